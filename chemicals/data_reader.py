@@ -169,11 +169,25 @@ def retrieve_from_df(df, index, key):
     if df_index.dtype is int64_dtype and isinstance(index, str):
         try: index = CAS_to_int(index)
         except: return None
-    if index in df_index:
-        if isinstance(key, (int, str)):
-            return get_value_from_df(df, index, key)
-        else: # Assume its an iterable of strings
-            return [float(df.at[index, i]) for i in key]
+    if isinstance(key, (int, str)):
+        # Hot path for Tb/Tm/etc. lookups; a single .at probe avoids hashing
+        # the index twice per data source
+        try:
+            value = df.at[index, key]
+        except KeyError:
+            return None
+        if value.__class__ is str:
+            # String cells (e.g. the ODP ranges) are documented to be
+            # returned verbatim, even when they parse as numbers
+            return value
+        if value != value: # Inline NaN check
+            return None
+        try:
+            return float(value)
+        except TypeError: # Not a number
+            return value
+    elif index in df_index: # Assume its an iterable of strings
+        return [float(df.at[index, i]) for i in key]
 
 def retrieve_any_from_df(df, index, keys):
     df_index = df.index
@@ -183,7 +197,9 @@ def retrieve_any_from_df(df, index, keys):
     if index not in df.index: return None
     for key in keys:
         value = df.at[index, key]
-        if not isnan(value):
+        if value.__class__ is str:
+            return value
+        if value == value: # Inline not-NaN check
             try:
                 return float(value)
             except: # pragma: no cover
@@ -191,8 +207,13 @@ def retrieve_any_from_df(df, index, keys):
 
 def get_value_from_df(df, index, key):
     value = df.at[index, key]
+    if value.__class__ is str:
+        # String cells are returned verbatim, even when they parse as numbers
+        return value
+    if value != value: # Inline NaN check
+        return None
     try:
-        return None if isnan(value) else float(value)
+        return float(value)
     except TypeError: # Not a number
         return value
 
@@ -64,6 +64,10 @@ to_change = ['utils.zs_to_ws', 'utils.ws_to_zs', 'utils.zs_to_Vfs',
      'thermal_conductivity.Lindsay_Bromley',
      'thermal_conductivity.DIPPR9I',
 
+     'phase_change.Pitzer_vec',
+     'phase_change.SMK_vec',
+     'phase_change.Watson_vec',
+
      'virial.Z_from_virial_density_form',
 
      'virial.CVirial_Liu_Xiang_vec',
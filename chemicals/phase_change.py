@@ -59,11 +59,14 @@ Heat of Vaporization at Tb Correlations
 Heat of Vaporization at T Correlations
 --------------------------------------
 .. autofunction:: chemicals.phase_change.Pitzer
+.. autofunction:: chemicals.phase_change.Pitzer_vec
 .. autofunction:: chemicals.phase_change.SMK
+.. autofunction:: chemicals.phase_change.SMK_vec
 .. autofunction:: chemicals.phase_change.MK
 .. autofunction:: chemicals.phase_change.Velasco
 .. autofunction:: chemicals.phase_change.Clapeyron
 .. autofunction:: chemicals.phase_change.Watson
+.. autofunction:: chemicals.phase_change.Watson_vec
 .. autofunction:: chemicals.phase_change.Watson_n
 
 Heat of Vaporization at T Model Equations
@@ -127,13 +130,15 @@ The structure of each dataframe is shown below:
 """
 
 __all__ = ['Tb_methods', 'Tb', 'Tm_methods', 'Tm',
-           'Clapeyron', 'Pitzer', 'SMK', 'MK', 'Velasco', 'Riedel', 'Chen',
-           'Liu', 'Vetere', 'Alibakhshi','PPDS12', 'Watson', 'Watson_n',
+           'Clapeyron', 'Pitzer', 'Pitzer_vec', 'SMK', 'SMK_vec', 'MK', 'Velasco', 'Riedel', 'Chen',
+           'Liu', 'Vetere', 'Alibakhshi','PPDS12', 'Watson', 'Watson_vec', 'Watson_n',
            'Hfus', 'Hfus_methods']
 
 
+from math import log1p
+
 from fluids.constants import N_A, R, pi
-from fluids.numerics import log
+from fluids.numerics import exp, log
 from fluids.numerics import numpy as np
 
 from chemicals import data_reader as dr
@@ -151,16 +156,29 @@ from chemicals.utils import PY37, can_load_data, mark_numba_incompatible, os_pat
 ###  Register data sources and lazy load them
 
 folder = os_path_join(source_path, 'Phase Change')
-register_df_source(folder, 'Yaws Boiling Points.tsv')
-register_df_source(folder, 'OpenNotebook Melting Points.tsv')
+register_df_source(folder, 'Yaws Boiling Points.tsv',
+                   csv_kwargs={'dtype': {'Tb': float}})
+register_df_source(folder, 'OpenNotebook Melting Points.tsv',
+                   csv_kwargs={'dtype': {'Tm': float}})
 register_df_source(folder, 'Ghazerati Appendix Vaporization Enthalpy.tsv',
                    csv_kwargs={'dtype': {'Hvap298': float}})
-register_df_source(folder, 'CRC Handbook Heat of Vaporization.tsv')
-register_df_source(folder, 'CRC Handbook Heat of Fusion.tsv')
-register_df_source(folder, 'Ghazerati Appendix Sublimation Enthalpy.tsv')
-register_df_source(folder, 'Table 2-150 Heats of Vaporization of Inorganic and Organic Liquids.tsv')
-register_df_source(folder, 'VDI PPDS Enthalpies of vaporization.tsv')
-register_df_source(folder, 'Alibakhshi one-coefficient enthalpy of vaporization.tsv')
+register_df_source(folder, 'CRC Handbook Heat of Vaporization.tsv',
+                   csv_kwargs={'dtype': {'Tb': float, 'HvapTb': float,
+                                         'Hvap298': float}})
+register_df_source(folder, 'CRC Handbook Heat of Fusion.tsv',
+                   csv_kwargs={'dtype': {'Hfus': float}})
+register_df_source(folder, 'Ghazerati Appendix Sublimation Enthalpy.tsv',
+                   csv_kwargs={'dtype': {'Hsub': float, 'error': float}})
+register_df_source(folder, 'Table 2-150 Heats of Vaporization of Inorganic and Organic Liquids.tsv',
+                   csv_kwargs={'dtype': {'Tc': float, 'C1': float, 'C2': float,
+                                         'C3': float, 'C4': float,
+                                         'Tmin': float, 'Tmax': float}})
+register_df_source(folder, 'VDI PPDS Enthalpies of vaporization.tsv',
+                   csv_kwargs={'dtype': {'MW': float, 'Tc': float, 'A': float,
+                                         'B': float, 'C': float, 'D': float,
+                                         'E': float}})
+register_df_source(folder, 'Alibakhshi one-coefficient enthalpy of vaporization.tsv',
+                   csv_kwargs={'dtype': {'C': float}})
 
 CRC_ORG = 'CRC_ORG'
 CRC_INORG = 'CRC_INORG'
@@ -168,19 +186,10 @@ YAWS = 'YAWS'
 OPEN_NTBKM = 'OPEN_NTBKM'
 CRC = 'CRC'
 
-_phase_change_const_loaded = False
 @mark_numba_incompatible
-def _load_phase_change_constants():
-    global Tb_data_Yaws, Tm_ON_data, Hvap_data_Gharagheizi, Hvap_data_CRC
-    global Hfus_data_CRC, Hsub_data_Gharagheizi, _phase_change_const_loaded
-    global Tb_sources, Tm_sources, Hfus_sources
+def _load_Tb_sources():
+    global Tb_data_Yaws, Tb_sources
     Tb_data_Yaws = data_source('Yaws Boiling Points.tsv')
-    Tm_ON_data = data_source('OpenNotebook Melting Points.tsv')
-    Hvap_data_Gharagheizi = data_source('Ghazerati Appendix Vaporization Enthalpy.tsv')
-    Hvap_data_CRC = data_source('CRC Handbook Heat of Vaporization.tsv')
-    Hfus_data_CRC = data_source('CRC Handbook Heat of Fusion.tsv')
-    Hsub_data_Gharagheizi = data_source('Ghazerati Appendix Sublimation Enthalpy.tsv')
-    _phase_change_const_loaded = True
     Tb_sources = {
         miscdata.HEOS: miscdata.heos_data,
         CRC_ORG: miscdata.CRC_organic_data,
@@ -191,6 +200,11 @@ def _load_phase_change_constants():
         miscdata.WIKIDATA: miscdata.wikidata_data,
         miscdata.JOBACK: miscdata.joback_predictions,
     }
+
+@mark_numba_incompatible
+def _load_Tm_sources():
+    global Tm_ON_data, Tm_sources
+    Tm_ON_data = data_source('OpenNotebook Melting Points.tsv')
     Tm_sources = {
         OPEN_NTBKM: Tm_ON_data,
         CRC_INORG: miscdata.CRC_inorganic_data,
@@ -200,6 +214,11 @@ def _load_phase_change_constants():
         miscdata.WIKIDATA: miscdata.wikidata_data,
         miscdata.JOBACK: miscdata.joback_predictions,
     }
+
+@mark_numba_incompatible
+def _load_Hfus_sources():
+    global Hfus_data_CRC, Hfus_sources
+    Hfus_data_CRC = data_source('CRC Handbook Heat of Fusion.tsv')
     Hfus_sources = {
         CRC: Hfus_data_CRC,
         miscdata.WEBBOOK: miscdata.webbook_data,
@@ -207,6 +226,19 @@ def _load_phase_change_constants():
         miscdata.JOBACK: miscdata.joback_predictions,
     }
 
+_phase_change_const_loaded = False
+@mark_numba_incompatible
+def _load_phase_change_constants():
+    global Hvap_data_Gharagheizi, Hvap_data_CRC
+    global Hsub_data_Gharagheizi, _phase_change_const_loaded
+    _load_Tb_sources()
+    _load_Tm_sources()
+    _load_Hfus_sources()
+    Hvap_data_Gharagheizi = data_source('Ghazerati Appendix Vaporization Enthalpy.tsv')
+    Hvap_data_CRC = data_source('CRC Handbook Heat of Vaporization.tsv')
+    Hsub_data_Gharagheizi = data_source('Ghazerati Appendix Sublimation Enthalpy.tsv')
+    _phase_change_const_loaded = True
+
 
 _phase_change_corrs_loaded = False
 @mark_numba_incompatible
@@ -228,9 +260,17 @@ def _load_phase_change_correlations():
 
 if PY37:
     def __getattr__(name):
-        if name in ('Tb_data_Yaws', 'Tm_ON_data', 'Hvap_data_Gharagheizi',
-                    'Hvap_data_CRC', 'Hfus_data_CRC', 'Hsub_data_Gharagheizi',
-                    'Tb_sources', 'Tm_sources', 'Hfus_sources'):
+        if name in ('Tb_data_Yaws', 'Tb_sources'):
+            _load_Tb_sources()
+            return globals()[name]
+        elif name in ('Tm_ON_data', 'Tm_sources'):
+            _load_Tm_sources()
+            return globals()[name]
+        elif name in ('Hfus_data_CRC', 'Hfus_sources'):
+            _load_Hfus_sources()
+            return globals()[name]
+        elif name in ('Hvap_data_Gharagheizi', 'Hvap_data_CRC',
+                      'Hsub_data_Gharagheizi'):
             _load_phase_change_constants()
             return globals()[name]
         elif name in ('phase_change_data_Perrys2_150',
@@ -246,6 +286,9 @@ else:
         _load_phase_change_constants()
         _load_phase_change_correlations()
 
+LOG_1E5 = 11.512925464970229
+"""Precomputed log(1e5), for rescaling Pa to the bar-based correlations."""
+
 ### Phase change functions
 
 ### Boiling Point at 1 atm
@@ -273,8 +316,12 @@ def Tb_methods(CASRN):
     --------
     Tb
     """
-    if not _phase_change_const_loaded: _load_phase_change_constants()
-    return list_available_methods_from_df_dict(Tb_sources, CASRN, 'Tb')
+    try:
+        sources = Tb_sources
+    except NameError:
+        _load_Tb_sources()
+        sources = Tb_sources
+    return list_available_methods_from_df_dict(sources, CASRN, 'Tb')
 
 @mark_numba_incompatible
 def Tb(CASRN, method=None):
@@ -351,11 +398,15 @@ def Tb(CASRN, method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'Tb')
         if found: return val
-    if not _phase_change_const_loaded: _load_phase_change_constants()
+    try:
+        sources = Tb_sources
+    except NameError:
+        _load_Tb_sources()
+        sources = Tb_sources
     if method:
-        return retrieve_from_df_dict(Tb_sources, CASRN, 'Tb', method)
+        return retrieve_from_df_dict(sources, CASRN, 'Tb', method)
     else:
-        return retrieve_any_from_df_dict(Tb_sources, CASRN, 'Tb')
+        return retrieve_any_from_df_dict(sources, CASRN, 'Tb')
 
 ### Melting Point
 
@@ -382,8 +433,12 @@ def Tm_methods(CASRN):
     --------
     Tm
     """
-    if not _phase_change_const_loaded: _load_phase_change_constants()
-    return list_available_methods_from_df_dict(Tm_sources, CASRN, 'Tm')
+    try:
+        sources = Tm_sources
+    except NameError:
+        _load_Tm_sources()
+        sources = Tm_sources
+    return list_available_methods_from_df_dict(sources, CASRN, 'Tm')
 
 @mark_numba_incompatible
 def Tm(CASRN, method=None):
@@ -456,11 +511,15 @@ def Tm(CASRN, method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'Tm')
         if found: return val
-    if not _phase_change_const_loaded: _load_phase_change_constants()
+    try:
+        sources = Tm_sources
+    except NameError:
+        _load_Tm_sources()
+        sources = Tm_sources
     if method:
-        return retrieve_from_df_dict(Tm_sources, CASRN, 'Tm', method)
+        return retrieve_from_df_dict(sources, CASRN, 'Tm', method)
     else:
-        return retrieve_any_from_df_dict(Tm_sources, CASRN, 'Tm')
+        return retrieve_any_from_df_dict(sources, CASRN, 'Tm')
 
 
 ### Enthalpy of Vaporization at T
@@ -560,7 +619,7 @@ def Pitzer(T, Tc, omega):
     Example as in [3]_, p2-487; exp: 37.51 kJ/mol
 
     >>> Pitzer(452, 645.6, 0.35017)
-    36696.749078320056
+    36696.74907832005
 
     References
     ----------
@@ -575,8 +634,46 @@ def Pitzer(T, Tc, omega):
     '''
     if T >= Tc:
         return 0.0
-    Tr = T/Tc
-    return R*Tc * (7.08*(1. - Tr)**0.354 + 10.95*omega*(1. - Tr)**0.456)
+    logtau = log(1. - T/Tc)
+    return R*Tc * (7.08*exp(logtau*0.354) + 10.95*omega*exp(logtau*0.456))
+
+def Pitzer_vec(T, Tcs, omegas, Hvaps=None):
+    r'''Perform a vectorized calculation of the Pitzer enthalpy of
+    vaporization correlation, evaluating many chemicals at a single
+    temperature. See :obj:`Pitzer` for the model equation and references.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of fluid [K]
+    Tcs : list[float]
+        Critical temperatures of fluids [K]
+    omegas : list[float]
+        Acentric factors of fluids [-]
+    Hvaps : list[float], optional
+        Array for enthalpies of vaporization, [J/mol]
+
+    Returns
+    -------
+    Hvaps : list[float]
+        Enthalpies of vaporization, [J/mol]
+
+    Notes
+    -----
+    Chemicals with `Tc` below `T` have an enthalpy of vaporization of zero,
+    as in :obj:`Pitzer`.
+
+    Examples
+    --------
+    >>> Pitzer_vec(452.0, [645.6, 647.096], [0.35017, 0.344])
+    [36696.7490783, 36648.0924244]
+    '''
+    N = len(Tcs)
+    if Hvaps is None:
+        Hvaps = [0.0]*N
+    for i in range(N):
+        Hvaps[i] = Pitzer(T, Tcs[i], omegas[i])
+    return Hvaps
 
 def SMK(T, Tc, omega):
     r'''Calculates enthalpy of vaporization at arbitrary temperatures using a
@@ -668,12 +765,13 @@ def SMK(T, Tc, omega):
     B11 = 99.00008
     B21 = 19.10458
     B31 = -2.795660
-    # 1 branch, two powers, 1 division
+    # 1 branch, one log, two exps, 1 division
     tau = 1. - T/Tc
-    tau_16 = tau**(1.0/6.0)
+    logtau = log(tau)
+    tau_16 = exp(logtau*(1.0/6.0))
     tau_13 = tau_16*tau_16
     tau_56 = tau_13*tau_13*tau_16
-    tau_other = tau**1.2083333333333333 #(1-1/8. + 1/3.))
+    tau_other = exp(logtau*1.2083333333333333) #(1-1/8. + 1/3.))
     L0 = (A10*tau_13 + A20*tau_56 + A30*tau_other +
           tau*(B10 + tau*(B20 + B30*tau)))
 
@@ -684,6 +782,45 @@ def SMK(T, Tc, omega):
 #    domega = (omega - omegaR1)/(omegaR2 - omegaR1)
     return R*Tc*(L0 + domega*L1)
 
+def SMK_vec(Ts, Tc, omega, Hvaps=None):
+    r'''Perform a vectorized calculation of the SMK enthalpy of vaporization
+    correlation, evaluating one chemical over an array of temperatures as
+    needed for fitting and optimizer sweeps. See :obj:`SMK` for the model
+    equations and references.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures of fluid [K]
+    Tc : float
+        Critical temperature of fluid [K]
+    omega : float
+        Acentric factor [-]
+    Hvaps : list[float], optional
+        Array for enthalpies of vaporization, [J/mol]
+
+    Returns
+    -------
+    Hvaps : list[float]
+        Enthalpies of vaporization, [J/mol]
+
+    Notes
+    -----
+    Temperatures at or above `Tc` give an enthalpy of vaporization of zero,
+    as in :obj:`SMK`.
+
+    Examples
+    --------
+    >>> SMK_vec([533.15, 553.15], 751.35, 0.302)
+    [41237.8898527, 39866.1899904]
+    '''
+    N = len(Ts)
+    if Hvaps is None:
+        Hvaps = [0.0]*N
+    for i in range(N):
+        Hvaps[i] = SMK(Ts[i], Tc, omega)
+    return Hvaps
+
 def MK(T, Tc, omega):
     r'''Calculates enthalpy of vaporization at arbitrary temperatures using a
     the work of [1]_; requires a chemical's critical temperature and
@@ -743,28 +880,31 @@ def MK(T, Tc, omega):
     '''
     if T >= Tc:
         return 0.0
-    bs0 = [5.2804, 0.080022, 7.2543]
-    bs1 = [12.8650, 273.23, -346.45]
-    bs2 = [1.1710, 465.08, -610.48]
-    bs3 = [-13.1160, -638.51, 839.89]
-    bs4 = [0.4858, -145.12, 160.05]
-    bs5 = [-1.0880, 74.049, -50.711]
+    b10, b20, b30 = 5.2804, 12.8650, 1.1710
+    b40, b50, b60 = -13.1160, 0.4858, -1.0880
+
+    b11, b21, b31 = 0.080022, 273.23, 465.08
+    b41, b51, b61 = -638.51, -145.12, 74.049
+
+    b12, b22, b32 = 7.2543, -346.45, -610.48
+    b42, b52, b62 = 839.89, 160.05, -50.711
 
     tau = 1. - T/Tc
-    tau_third = tau**0.3333
-    tau_83 = tau**0.8333
-    tau_other = tau**1.2083
+    logtau = log(tau)
+    tau_third = exp(logtau*0.3333)
+    tau_83 = exp(logtau*0.8333)
+    tau_other = exp(logtau*1.2083)
     tau2 = tau*tau
     tau3 = tau2*tau
 
-    H0 = (bs0[0]*tau_third + bs1[0]*tau_83 + bs2[0]*tau_other +
-    bs3[0]*tau + bs4[0]*tau2 + bs5[0]*tau3)
+    H0 = (b10*tau_third + b20*tau_83 + b30*tau_other +
+    b40*tau + b50*tau2 + b60*tau3)
 
-    H1 = (bs0[1]*tau_third + bs1[1]*tau_83 + bs2[1]*tau_other +
-    bs3[1]*tau + bs4[1]*tau2 + bs5[1]*tau3)
+    H1 = (b11*tau_third + b21*tau_83 + b31*tau_other +
+    b41*tau + b51*tau2 + b61*tau3)
 
-    H2 = (bs0[2]*tau_third + bs1[2]*tau_83 + bs2[2]*tau_other +
-    bs3[2]*tau + bs4[2]*tau2 + bs5[2]*tau3)
+    H2 = (b12*tau_third + b22*tau_83 + b32*tau_other +
+    b42*tau + b52*tau2 + b62*tau3)
 
     return (H0 + omega*(H1 + omega*H2))*R*Tc
 
@@ -818,7 +958,7 @@ def Velasco(T, Tc, omega):
     '''
     if T >= Tc:
         return 0.0
-    return (7.2729 + 10.4962*omega + 0.6061*omega**2)*(1-T/Tc)**0.38*R*Tc
+    return (7.2729 + 10.4962*omega + 0.6061*(omega*omega))*(1.0 - T/Tc)**0.38*R*Tc
 
 ### Enthalpy of Vaporization at Normal Boiling Point.
 
@@ -862,7 +1002,7 @@ def Riedel(Tb, Tc, Pc):
     Pyridine, 0.0% err vs. exp: 35090 J/mol; from Poling [2]_.
 
     >>> Riedel(388.4, 620.0, 56.3E5)
-    35089.80179000598
+    35089.80179000596
 
     References
     ----------
@@ -875,9 +1015,9 @@ def Riedel(Tb, Tc, Pc):
     .. [3] Green, Don, and Robert Perry. Perry's Chemical Engineers' Handbook,
        Eighth Edition. McGraw-Hill Professional, 2007.
     '''
-    Pc = Pc/1E5  # Pa to bar
     Tbr = Tb/Tc
-    return 1.093*Tb*R*(log(Pc) - 1.013)/(0.93 - Tbr)
+    # log(Pc/1e5) rewritten algebraically; saves the division
+    return 1.093*Tb*R*(log(Pc) - LOG_1E5 - 1.013)/(0.93 - Tbr)
 
 def Chen(Tb, Tc, Pc):
     r'''Calculates enthalpy of vaporization using the Chen [1]_ correlation
@@ -928,8 +1068,8 @@ def Chen(Tb, Tc, Pc):
        New York: McGraw-Hill Professional, 2000.
     '''
     Tbr = Tb/Tc
-    Pc = Pc/1E5  # Pa to bar
-    return R*Tb*(3.978*Tbr - 3.958 + 1.555*log(Pc))/(1.07 - Tbr)
+    # log(Pc/1e5) rewritten algebraically; saves the division
+    return R*Tb*(3.978*Tbr - 3.958 + 1.555*(log(Pc) - LOG_1E5))/(1.07 - Tbr)
 
 def Liu(Tb, Tc, Pc):
     r'''Calculates enthalpy of vaporization at the normal boiling point using
@@ -1038,9 +1178,9 @@ def Vetere(Tb, Tc, Pc, F=1.0):
        Eighth Edition. McGraw-Hill Professional, 2007.
     '''
     Tbr = Tb/Tc
-    taub = 1-Tb/Tc
-    Pc = Pc/1E5
-    term = taub**0.38*(log(Pc)-0.513 + 0.5066/Pc/Tbr**2) / (taub + F*(1-taub**0.38)*log(Tbr))
+    taub = 1.0 - Tbr
+    taub_38 = taub**0.38
+    term = taub_38*(log(Pc) - LOG_1E5 - 0.513 + 5.066E4/Pc/Tbr**2) / (taub + F*(1.0 - taub_38)*log(Tbr))
     return R*Tb*term
 
 ### Enthalpy of Vaporization adjusted for T
@@ -1083,7 +1223,7 @@ def Watson(T, Hvap_ref, T_ref, Tc, exponent=0.38):
     300 K:
 
     >>> Watson(T=320, Hvap_ref=43908, T_ref=300.0, Tc=647.14)
-    42928.990094915454
+    42928.99009491546
 
     The error is 0.38% compared to the correct value of 43048 J/mol.
 
@@ -1100,9 +1240,54 @@ def Watson(T, Hvap_ref, T_ref, Tc, exponent=0.38):
     Tr = T/Tc
     if Tr >= 1.0:
         return 0.0
-    Trefr = T_ref/Tc
-    H2 = Hvap_ref*((1.0 - Tr)/(1.0 - Trefr))**exponent
-    return H2
+    # Fused form of ((1-Tr)/(1-Trefr))**exponent; log1p keeps accuracy near Tc
+    return Hvap_ref*exp(exponent*(log1p(-Tr) - log1p(-T_ref/Tc)))
+
+def Watson_vec(Ts, Hvap_ref, T_ref, Tc, exponent=0.38, Hvaps=None):
+    r'''Perform a vectorized calculation of the Watson enthalpy of
+    vaporization extrapolation, evaluating one chemical over an array of
+    temperatures. See :obj:`Watson` for the model equation and references.
+
+    Parameters
+    ----------
+    Ts : list[float]
+        Temperatures for which to calculate heats of vaporization, [K]
+    Hvap_ref : float
+        Enthalpy of vaporization at the known temperature point, [J/mol]
+    T_ref : float
+        Reference temperature; ideally as close to the `Ts` as posible, [K]
+    Tc : float
+        Critical temperature of fluid [K]
+    exponent : float, optional
+        A fit exponent can optionally be used instead of the Watson 0.38
+        exponent, [-]
+    Hvaps : list[float], optional
+        Array for enthalpies of vaporization, [J/mol]
+
+    Returns
+    -------
+    Hvaps : list[float]
+        Enthalpies of vaporization at the requested temperatures, [J/mol]
+
+    Notes
+    -----
+    The reference-point denominator is computed only once for the whole
+    temperature array. Temperatures at or above `Tc` give zero.
+
+    Examples
+    --------
+    >>> Watson_vec([300.0, 320.0], Hvap_ref=43908, T_ref=300.0, Tc=647.14)
+    [43908.0, 42928.9900949]
+    '''
+    N = len(Ts)
+    if Hvaps is None:
+        Hvaps = [0.0]*N
+    x0 = exponent*log1p(-T_ref/Tc)
+    inv_Tc = 1.0/Tc
+    for i in range(N):
+        Tr = Ts[i]*inv_Tc
+        Hvaps[i] = Hvap_ref*exp(exponent*log1p(-Tr) - x0) if Tr < 1.0 else 0.0
+    return Hvaps
 
 def Watson_n(T1, T2, Hvap1, Hvap2, Tc):
     r'''Calculates the Watson heat of vaporizaton extrapolation exponent
@@ -1265,6 +1450,8 @@ def PPDS12(T, Tc, A, B, C, D, E):
 Hfus_all_methods = (CRC, miscdata.WEBBOOK, miscdata.WIKIDATA, miscdata.JOBACK)
 """Tuple of method name keys. See the `Hfus` for the actual references"""
 
+_Hfus_cache = {}
+
 @mark_numba_incompatible
 def Hfus_methods(CASRN):
     """Return all methods available to obtain the heat of fusion for the
@@ -1284,8 +1471,12 @@ def Hfus_methods(CASRN):
     --------
     Hfus
     """
-    if not _phase_change_const_loaded: _load_phase_change_constants()
-    return list_available_methods_from_df_dict(Hfus_sources, CASRN, 'Hfus')
+    try:
+        sources = Hfus_sources
+    except NameError:
+        _load_Hfus_sources()
+        sources = Hfus_sources
+    return list_available_methods_from_df_dict(sources, CASRN, 'Hfus')
 
 @mark_numba_incompatible
 def Hfus(CASRN, method=None):
@@ -1347,10 +1538,21 @@ def Hfus(CASRN, method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'Hfus')
         if found: return val
-    if not _phase_change_const_loaded: _load_phase_change_constants()
+    key = (CASRN, method)
+    try:
+        return _Hfus_cache[key]
+    except KeyError:
+        pass
+    try:
+        sources = Hfus_sources
+    except NameError:
+        _load_Hfus_sources()
+        sources = Hfus_sources
     if method:
-        return retrieve_from_df_dict(Hfus_sources, CASRN, 'Hfus', method)
+        value = retrieve_from_df_dict(sources, CASRN, 'Hfus', method)
     else:
-        return retrieve_any_from_df_dict(Hfus_sources, CASRN, 'Hfus')
+        value = retrieve_any_from_df_dict(sources, CASRN, 'Hfus')
+    _Hfus_cache[key] = value
+    return value
 
 
@@ -144,6 +144,11 @@ from chemicals.utils import PY37, R, can_load_data, mark_numba_incompatible, nor
 
 ### Utilities
 
+# Molar density P/(R*T) and molar volume R*T/P of an ideal gas at the default
+# conditions of 298.15 K and 101325 Pa, precomputed for the common case
+_inv_RT_STP = 101325.0/(R*298.15)
+_RT_P_STP = R*298.15/101325.0
+
 def ppmv_to_mgm3(ppmv, MW, T=298.15, P=101325.0):
     r'''
     Converts a concentration in ppmv to units of mg/m^3. Used in
@@ -185,10 +190,14 @@ def ppmv_to_mgm3(ppmv, MW, T=298.15, P=101325.0):
        23rd Edition. American Conference of Governmental and Industrial
        Hygenists, 2004.
     '''
-    parts = ppmv*1E-6
-    n = parts*P/(R*T)
-    mgm3 = MW*n*1000  # mol toxin /m^3 * g/mol toxis * 1000 mg/g
-    return mgm3
+    # ppmv*1E-6 is the mole fraction; P/(R*T) the gas molar density in mol/m^3;
+    # MW*1000 converts g/mol toxin to mg/mol. The single expression broadcasts
+    # over array inputs as well as floats.
+    # The type checks keep ndarray T or P out of the scalar fast path, where
+    # the elementwise comparison would not produce a single boolean
+    if type(T) is float and type(P) is float and T == 298.15 and P == 101325.0:
+        return MW*(ppmv*1E-6*_inv_RT_STP)*1000.0
+    return MW*(ppmv*1E-6*P/(R*T))*1000.0
 
 def mgm3_to_ppmv(mgm3, MW, T=298.15, P=101325.):
     r'''
@@ -231,10 +240,14 @@ def mgm3_to_ppmv(mgm3, MW, T=298.15, P=101325.):
        23rd Edition. American Conference of Governmental and Industrial
        Hygenists, 2004.
     '''
-    n = mgm3/MW/1000.
-    parts = n*R*T/P
-    ppm = parts/1E-6
-    return ppm
+    # mgm3/MW/1000. is the toxin molar concentration in mol/m^3; R*T/P the
+    # molar volume in m^3/mol; /1E-6 scales the mole fraction to ppm. The
+    # single expression broadcasts over array inputs as well as floats.
+    # The type checks keep ndarray T or P out of the scalar fast path, where
+    # the elementwise comparison would not produce a single boolean
+    if type(T) is float and type(P) is float and T == 298.15 and P == 101325.0:
+        return mgm3/MW/1000.*_RT_P_STP/1E-6
+    return mgm3/MW/1000.*R*T/P/1E-6
 
 ### Data
 
@@ -246,14 +259,17 @@ IARC_codes = {1: 'Carcinogenic to humans (1)',
               3: 'Not classifiable as to its carcinogenicity to humans (3)',
               4: 'Probably not carcinogenic to humans (4)'}
 
+# Tuple views of the code tables; indexing by the small integer codes
+# skips dict hashing in the Carcinogen hot path
+_NTP_codes_seq = tuple(NTP_codes.get(i) for i in range(3))
+_IARC_codes_seq = tuple(IARC_codes.get(i) for i in range(13))
+
 folder = os_path_join(source_path, 'Safety')
 register_df_source(folder, 'NFPA 497 2008.tsv')
 register_df_source(folder, 'IS IEC 60079-20-1 2010.tsv')
 register_df_source(folder, 'DIPPR T_flash Serat.csv')
 register_df_source(folder, 'National Toxicology Program Carcinogens.tsv')
 register_df_source(folder, 'IARC Carcinogen Database.tsv')
-_safety_data_loaded = False
-
 
 IEC = 'IEC 60079-20-1 (2010)'
 NFPA = 'NFPA 497 (2008)'
@@ -262,19 +278,41 @@ SERAT = 'Serat DIPPR (2017)'
 SUZUKI = 'Suzuki (1994)'
 CROWLLOUVAR = 'Crowl and Louvar (2001)'
 
-def _load_safety_data():
-    global Ontario_exposure_limits_dict, NFPA_2008_data, IEC_2010_data
-    global DIPPR_SERAT_data, NTP_data, IARC_data, Tflash_sources
-    global Tautoignition_sources, LFL_sources, UFL_sources, _safety_data_loaded
+def _load_ontario_data():
+    global Ontario_exposure_limits_dict
     import json
     file = os_path_join(folder, 'Ontario Exposure Limits.json')
-    with open(file) as stream:
-        Ontario_exposure_limits_dict = json.load(stream)
+    # Read the whole file and parse the bytes in one shot; json.loads is
+    # faster than json.load feeding the parser through a stream wrapper
+    with open(file, 'rb') as stream:
+        Ontario_exposure_limits_dict = json.loads(stream.read())
+    global _has_TWA, _has_STEL, _has_Ceiling
+    _has_TWA = has_TWA = set()
+    _has_STEL = has_STEL = set()
+    _has_Ceiling = has_Ceiling = set()
+    for CASRN, data in Ontario_exposure_limits_dict.items():
+        if data["TWA (ppm)"] or data["TWA (mg/m^3)"]:
+            has_TWA.add(CASRN)
+        if data["STEL (ppm)"] or data["STEL (mg/m^3)"]:
+            has_STEL.add(CASRN)
+        if data["Ceiling (ppm)"] or data["Ceiling (mg/m^3)"]:
+            has_Ceiling.add(CASRN)
+
+def _load_carcinogen_data():
+    global NTP_data, IARC_data, _IARC_group_dict, _NTP_listing_dict
+    NTP_data = data_source('National Toxicology Program Carcinogens.tsv')
+    IARC_data = data_source('IARC Carcinogen Database.tsv')
+    # Plain dicts for the lookup columns; pandas .at and index membership
+    # cost microseconds per call while a dict probe is tens of ns
+    _IARC_group_dict = IARC_data['group'].to_dict()
+    _NTP_listing_dict = NTP_data['Listing'].to_dict()
+
+def _load_fire_data():
+    global NFPA_2008_data, IEC_2010_data, DIPPR_SERAT_data, Tflash_sources
+    global Tautoignition_sources, LFL_sources, UFL_sources
     NFPA_2008_data = data_source('NFPA 497 2008.tsv')
     IEC_2010_data = data_source('IS IEC 60079-20-1 2010.tsv')
     DIPPR_SERAT_data = data_source('DIPPR T_flash Serat.csv')
-    NTP_data = data_source('National Toxicology Program Carcinogens.tsv')
-    IARC_data = data_source('IARC Carcinogen Database.tsv')
     Tflash_sources = {IEC: IEC_2010_data,
                       NFPA: NFPA_2008_data,
                       SERAT: DIPPR_SERAT_data,
@@ -283,15 +321,25 @@ def _load_safety_data():
     Tautoignition_sources = {IEC: IEC_2010_data,
                              NFPA: NFPA_2008_data,
                              miscdata.WIKIDATA: miscdata.wikidata_data}
-    LFL_sources = Tautoignition_sources.copy()
-    UFL_sources = Tautoignition_sources.copy()
-    _safety_data_loaded = True
+    # The source dicts are never mutated after load, so the flammability
+    # limits can share the autoignition dict instead of copying it
+    LFL_sources = UFL_sources = Tautoignition_sources
+
+def _load_safety_data():
+    _load_ontario_data()
+    _load_carcinogen_data()
+    _load_fire_data()
 
 if PY37:
     def __getattr__(name):
-        if name in ('Ontario_exposure_limits_dict', 'NFPA_2008_data', 'IEC_2010_data',
-                    'DIPPR_SERAT_data'):
-            _load_safety_data()
+        if name == 'Ontario_exposure_limits_dict':
+            _load_ontario_data()
+            return globals()[name]
+        if name in ('NTP_data', 'IARC_data'):
+            _load_carcinogen_data()
+            return globals()[name]
+        if name in ('NFPA_2008_data', 'IEC_2010_data', 'DIPPR_SERAT_data'):
+            _load_fire_data()
             return globals()[name]
         raise AttributeError(f"module {__name__} has no attribute {name}")
 else: # pragma: no cover
@@ -427,11 +475,12 @@ def TWA_methods(CASRN):
     >>> TWA_methods('71-43-2')
     ['Ontario Limits']
     """
-    if not _safety_data_loaded: _load_safety_data()
-    if CASRN in Ontario_exposure_limits_dict:
-        data = Ontario_exposure_limits_dict[CASRN]
-        if (data["TWA (ppm)"] or data["TWA (mg/m^3)"]): return [ONTARIO]
-    return []
+    try:
+        has_values = _has_TWA
+    except NameError:
+        _load_ontario_data()
+        has_values = _has_TWA
+    return [ONTARIO] if CASRN in has_values else []
 
 @mark_numba_incompatible
 def TWA(CASRN, method=None):
@@ -465,10 +514,14 @@ def TWA(CASRN, method=None):
     >>> TWA('1303-00-0')
     (5.0742430905659505e-05, 'ppm')
     """
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        limits = Ontario_exposure_limits_dict
+    except NameError:
+        _load_ontario_data()
+        limits = Ontario_exposure_limits_dict
     if not method or method == ONTARIO:
-        if CASRN in Ontario_exposure_limits_dict:
-            data = Ontario_exposure_limits_dict[CASRN]
+        data = limits.get(CASRN)
+        if data is not None:
             value = data["TWA (ppm)"]
             if value: return value, 'ppm'
             value = data["TWA (mg/m^3)"]
@@ -494,11 +547,12 @@ def STEL_methods(CASRN):
     --------
     STEL
     """
-    if not _safety_data_loaded: _load_safety_data()
-    if CASRN in Ontario_exposure_limits_dict:
-        data = Ontario_exposure_limits_dict[CASRN]
-        if (data["STEL (ppm)"] or data["STEL (mg/m^3)"]): return [ONTARIO]
-    return []
+    try:
+        has_values = _has_STEL
+    except NameError:
+        _load_ontario_data()
+        has_values = _has_STEL
+    return [ONTARIO] if CASRN in has_values else []
 
 @mark_numba_incompatible
 def STEL(CASRN, method=None):
@@ -534,16 +588,20 @@ def STEL(CASRN, method=None):
     >>> STEL('55720-99-5')
     (2.0, 'mg/m^3')
     """
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        limits = Ontario_exposure_limits_dict
+    except NameError:
+        _load_ontario_data()
+        limits = Ontario_exposure_limits_dict
     if not method or method == ONTARIO:
-        if CASRN in Ontario_exposure_limits_dict:
-            data = Ontario_exposure_limits_dict[CASRN]
+        data = limits.get(CASRN)
+        if data is not None:
             value = data["STEL (ppm)"]
             if value: return value, 'ppm'
             value = data["STEL (mg/m^3)"]
             if value: return value, 'mg/m^3'
     else:
-        raise ValueError(f'Invalid method: {method}, allowed methods are {TWA_all_methods}')
+        raise ValueError(f'Invalid method: {method}, allowed methods are {STEL_all_methods}')
 
 @mark_numba_incompatible
 def Ceiling_methods(CASRN):
@@ -564,11 +622,12 @@ def Ceiling_methods(CASRN):
     --------
     Ceiling
     """
-    if not _safety_data_loaded: _load_safety_data()
-    if CASRN in Ontario_exposure_limits_dict:
-        data = Ontario_exposure_limits_dict[CASRN]
-        if (data["Ceiling (ppm)"] or data["Ceiling (mg/m^3)"]): return [ONTARIO]
-    return []
+    try:
+        has_values = _has_Ceiling
+    except NameError:
+        _load_ontario_data()
+        has_values = _has_Ceiling
+    return [ONTARIO] if CASRN in has_values else []
 
 @mark_numba_incompatible
 def Ceiling(CASRN, method=None):
@@ -596,16 +655,20 @@ def Ceiling(CASRN, method=None):
     >>> Ceiling('1395-21-7')
     (6e-05, 'mg/m^3')
     """
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        limits = Ontario_exposure_limits_dict
+    except NameError:
+        _load_ontario_data()
+        limits = Ontario_exposure_limits_dict
     if not method or method == ONTARIO:
-        if CASRN in Ontario_exposure_limits_dict:
-            data = Ontario_exposure_limits_dict[CASRN]
+        data = limits.get(CASRN)
+        if data is not None:
             value = data["Ceiling (ppm)"]
             if value: return value, 'ppm'
             value = data["Ceiling (mg/m^3)"]
             if value: return value, 'mg/m^3'
     else:
-        raise ValueError(f'Invalid method: {method}, allowed methods are {list(Ontario_exposure_limits_dict)}')
+        raise ValueError(f'Invalid method: {method}, allowed methods are {Ceiling_all_methods}')
 
 @mark_numba_incompatible
 def Skin_methods(CASRN):
@@ -627,7 +690,12 @@ def Skin_methods(CASRN):
     --------
     Skin
     """
-    return [ONTARIO] if CASRN in Ontario_exposure_limits_dict else []
+    try:
+        limits = Ontario_exposure_limits_dict
+    except NameError:
+        _load_ontario_data()
+        limits = Ontario_exposure_limits_dict
+    return [ONTARIO] if CASRN in limits else []
 
 @mark_numba_incompatible
 def Skin(CASRN, method=None):
@@ -653,12 +721,17 @@ def Skin(CASRN, method=None):
     >>> Skin('1395-21-7')
     False
     """
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        limits = Ontario_exposure_limits_dict
+    except NameError:
+        _load_ontario_data()
+        limits = Ontario_exposure_limits_dict
     if not method or method == ONTARIO:
-        if CASRN in Ontario_exposure_limits_dict:
-            return Ontario_exposure_limits_dict[CASRN]["Skin"]
+        data = limits.get(CASRN)
+        if data is not None:
+            return data["Skin"]
     else:
-        raise ValueError(f'Invalid method: {method}, allowed methods are {TWA_all_methods}')
+        raise ValueError(f'Invalid method: {method}, allowed methods are {Skin_all_methods}')
 
 ### Carcinogen functions
 
@@ -743,18 +816,26 @@ def Carcinogen(CASRN, method=None):
        Health and Human Services, Public Health Service.
        https://doi.org/10.22427/NTP-OTHER-1003
     '''
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        IARC_groups, NTP_listings = _IARC_group_dict, _NTP_listing_dict
+    except NameError:
+        _load_carcinogen_data()
+        IARC_groups, NTP_listings = _IARC_group_dict, _NTP_listing_dict
     if not method:
+        group = IARC_groups.get(CASRN)
+        listing = NTP_listings.get(CASRN)
         return {
-            IARC: IARC_codes[IARC_data.at[CASRN, 'group']] if CASRN in IARC_data.index else UNLISTED,
-            NTP: NTP_codes[NTP_data.at[CASRN, 'Listing']] if CASRN in NTP_data.index else UNLISTED
+            IARC: _IARC_codes_seq[group] if group is not None else UNLISTED,
+            NTP: _NTP_codes_seq[listing] if listing is not None else UNLISTED
         }
     if method == IARC:
-        if CASRN in IARC_data.index:
-            return IARC_codes[IARC_data.at[CASRN, 'group']]
+        group = IARC_groups.get(CASRN)
+        if group is not None:
+            return _IARC_codes_seq[group]
     elif method == NTP:
-        if CASRN in NTP_data.index:
-            return NTP_codes[NTP_data.at[CASRN, 'Listing']]
+        listing = NTP_listings.get(CASRN)
+        if listing is not None:
+            return _NTP_codes_seq[listing]
     else:
         raise ValueError(f'Invalid method: {method}, allowed methods are {Carcinogen_all_methods}')
     return UNLISTED
@@ -784,8 +865,12 @@ def T_flash_methods(CASRN):
     --------
     T_flash
     """
-    if not _safety_data_loaded: _load_safety_data()
-    return list_available_methods_from_df_dict(Tflash_sources, CASRN, 'T_flash')
+    try:
+        sources = Tflash_sources
+    except NameError:
+        _load_fire_data()
+        sources = Tflash_sources
+    return list_available_methods_from_df_dict(sources, CASRN, 'T_flash')
 
 @mark_numba_incompatible
 def T_flash(CASRN, method=None):
@@ -850,11 +935,15 @@ def T_flash(CASRN, method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'T_flash')
         if found: return val
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        sources = Tflash_sources
+    except NameError:
+        _load_fire_data()
+        sources = Tflash_sources
     if method:
-        return retrieve_from_df_dict(Tflash_sources, CASRN, 'T_flash', method)
+        return retrieve_from_df_dict(sources, CASRN, 'T_flash', method)
     else:
-        return retrieve_any_from_df_dict(Tflash_sources, CASRN, 'T_flash')
+        return retrieve_any_from_df_dict(sources, CASRN, 'T_flash')
 
 
 T_autoignition_all_methods = (IEC, NFPA, miscdata.WIKIDATA)
@@ -879,8 +968,12 @@ def T_autoignition_methods(CASRN):
     --------
     T_autoignition
     """
-    if not _safety_data_loaded: _load_safety_data()
-    return list_available_methods_from_df_dict(Tautoignition_sources, CASRN, 'T_autoignition')
+    try:
+        sources = Tautoignition_sources
+    except NameError:
+        _load_fire_data()
+        sources = Tautoignition_sources
+    return list_available_methods_from_df_dict(sources, CASRN, 'T_autoignition')
 
 @mark_numba_incompatible
 def T_autoignition(CASRN, method=None):
@@ -936,11 +1029,15 @@ def T_autoignition(CASRN, method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'T_autoignition')
         if found: return val
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        sources = Tautoignition_sources
+    except NameError:
+        _load_fire_data()
+        sources = Tautoignition_sources
     if method:
-        return retrieve_from_df_dict(Tautoignition_sources, CASRN, 'T_autoignition', method)
+        return retrieve_from_df_dict(sources, CASRN, 'T_autoignition', method)
     else:
-        return retrieve_any_from_df_dict(Tautoignition_sources, CASRN, 'T_autoignition')
+        return retrieve_any_from_df_dict(sources, CASRN, 'T_autoignition')
 
 
 
@@ -976,8 +1073,12 @@ def LFL_methods(Hc=None, atoms=None, CASRN=''):
     >>> LFL_methods(Hc=-890590.0, atoms={'C': 1, 'H': 4}, CASRN='74-82-8')
     ['IEC 60079-20-1 (2010)', 'NFPA 497 (2008)', 'Suzuki (1994)', 'Crowl and Louvar (2001)']
     """
-    if not _safety_data_loaded: _load_safety_data()
-    methods = list_available_methods_from_df_dict(LFL_sources, CASRN, 'LFL')
+    try:
+        sources = LFL_sources
+    except NameError:
+        _load_fire_data()
+        sources = LFL_sources
+    methods = list_available_methods_from_df_dict(sources, CASRN, 'LFL')
     if Hc is not None:
         methods.append(SUZUKI)
     if atoms is not None:
@@ -1041,9 +1142,13 @@ def LFL(Hc=None, atoms=None, CASRN='', method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'LFL')
         if found: return val
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        sources = LFL_sources
+    except NameError:
+        _load_fire_data()
+        sources = LFL_sources
     if not method:
-        LFL = retrieve_any_from_df_dict(LFL_sources, CASRN, 'LFL')
+        LFL = retrieve_any_from_df_dict(sources, CASRN, 'LFL')
         if not LFL:
             if Hc == 0.0:
                 return None
@@ -1055,7 +1160,7 @@ def LFL(Hc=None, atoms=None, CASRN='', method=None):
     elif method == CROWLLOUVAR:
         return Crowl_Louvar_LFL(atoms)
     else:
-        return retrieve_from_df_dict(LFL_sources, CASRN, 'LFL', method)
+        return retrieve_from_df_dict(sources, CASRN, 'LFL', method)
 
 UFL_all_methods = (IEC, NFPA, miscdata.WIKIDATA, SUZUKI, CROWLLOUVAR)
 """Tuple of method name keys. See the :obj:`UFL` for the actual references"""
@@ -1089,8 +1194,12 @@ def UFL_methods(Hc=None, atoms=None, CASRN=''):
     >>> UFL_methods(Hc=-890590.0, atoms={'C': 1, 'H': 4}, CASRN='74-82-8')
     ['IEC 60079-20-1 (2010)', 'NFPA 497 (2008)', 'Suzuki (1994)', 'Crowl and Louvar (2001)']
     """
-    if not _safety_data_loaded: _load_safety_data()
-    methods = list_available_methods_from_df_dict(UFL_sources, CASRN, 'UFL')
+    try:
+        sources = UFL_sources
+    except NameError:
+        _load_fire_data()
+        sources = UFL_sources
+    methods = list_available_methods_from_df_dict(sources, CASRN, 'UFL')
     if Hc is not None:
         methods.append(SUZUKI)
     if atoms is not None:
@@ -1157,9 +1266,13 @@ def UFL(Hc=None, atoms=None, CASRN='', method=None):
     if dr.USE_CONSTANTS_DATABASE and method is None:
         val, found = database_constant_lookup(CASRN, 'UFL')
         if found: return val
-    if not _safety_data_loaded: _load_safety_data()
+    try:
+        sources = UFL_sources
+    except NameError:
+        _load_fire_data()
+        sources = UFL_sources
     if not method:
-        UFL = retrieve_any_from_df_dict(UFL_sources, CASRN, 'UFL')
+        UFL = retrieve_any_from_df_dict(sources, CASRN, 'UFL')
         if not UFL:
             if Hc is not None: UFL = Suzuki_UFL(Hc)
             elif atoms is not None: UFL = Crowl_Louvar_UFL(atoms)
@@ -1169,7 +1282,7 @@ def UFL(Hc=None, atoms=None, CASRN='', method=None):
     elif method == CROWLLOUVAR:
         return Crowl_Louvar_UFL(atoms)
     else:
-        return retrieve_from_df_dict(UFL_sources, CASRN, 'UFL', method)
+        return retrieve_from_df_dict(sources, CASRN, 'UFL', method)
 
 ISO_10156_2017_Kks = {
     '7782-44-7': 1.0, # O2,
@@ -1247,21 +1360,21 @@ def LFL_ISO_10156_2017(zs, LFLs, CASs):
        and Oxidizing Ability for the Selection of Cylinder Valve Outlets, 2017.
     '''
     N = len(zs)
-    has_inerts = False
-    for CAS in CASs:
-        if CAS in ISO_10156_2017_Kks:
-            has_inerts = True
-            break
-
-    if has_inerts:
-        combustible_idxs = []
-        combustible_zs = []
-        for i, CAS in enumerate(CASs):
+    # Split the components and accumulate the inert K sum in a single pass;
+    # .get probes the inert coefficient table once per component
+    combustible_idxs = []
+    combustible_zs = []
+    K = 0.0
+    for i in range(N):
+        Kk = ISO_10156_2017_Kks.get(CASs[i])
+        if Kk is None:
             # Combustible
-            if CAS not in ISO_10156_2017_Kks:
-                combustible_idxs.append(i)
-                combustible_zs.append(zs[i])
+            combustible_idxs.append(i)
+            combustible_zs.append(zs[i])
+        else:
+            K += Kk*zs[i]
 
+    if len(combustible_idxs) != N:
         combustible_zs_norm = normalize(combustible_zs)
         Lm_prime = 0.0
         for idx, zi in zip(combustible_idxs, combustible_zs_norm):
@@ -1270,10 +1383,6 @@ def LFL_ISO_10156_2017(zs, LFLs, CASs):
 
         combustible_frac = sum(combustible_zs)
         inert_frac = 1.0 - combustible_frac
-        K = 0.0
-        for i, CAS in enumerate(CASs):
-            if CAS in ISO_10156_2017_Kks:
-                K += ISO_10156_2017_Kks[CAS]*zs[i]
         K /= inert_frac
 
         factor = ((1.0 - Lm_prime - (1.0 - K)*inert_frac/combustible_frac*Lm_prime)
@@ -1435,6 +1544,19 @@ def Suzuki_UFL(Hc):
     UFL = 6.3*Hc + 0.567*Hc*Hc + 23.5
     return UFL/100.
 
+@mark_numba_incompatible
+def _Crowl_Louvar_denom(atoms):
+    '''Compute the stoichiometric denominator 4.76*m + 1.19*x - 2.38*y + 1
+    shared by :obj:`Crowl_Louvar_LFL` and :obj:`Crowl_Louvar_UFL`, or None
+    if the molecule has no carbon.
+    '''
+    nC = atoms.get('C', 0)
+    if not nC:
+        return None
+    nH = atoms.get('H', 0)
+    nO = atoms.get('O', 0)
+    return 4.76*nC + 1.19*nH - 2.38*nO + 1.
+
 @mark_numba_incompatible
 def Crowl_Louvar_LFL(atoms):
     r'''Calculates lower flammability limit, using the Crowl-Louvar [1]_
@@ -1477,16 +1599,10 @@ def Crowl_Louvar_LFL(atoms):
        in Hazardous Industrial Operations." Chemical Reviews 22, no. 1
        (February 1, 1938): 1-26. doi:10.1021/cr60071a001
     '''
-    nC, nH, nO = 0, 0, 0
-    if atoms.get('C'):
-        nC = atoms['C']
-    else:
+    denom = _Crowl_Louvar_denom(atoms)
+    if denom is None:
         return None
-    if 'H' in atoms:
-        nH = atoms['H']
-    if 'O' in atoms:
-        nO = atoms['O']
-    return 0.55/(4.76*nC + 1.19*nH - 2.38*nO + 1.)
+    return 0.55/denom
 
 @mark_numba_incompatible
 def Crowl_Louvar_UFL(atoms):
@@ -1530,16 +1646,10 @@ def Crowl_Louvar_UFL(atoms):
        in Hazardous Industrial Operations." Chemical Reviews 22, no. 1
        (February 1, 1938): 1-26. doi:10.1021/cr60071a001
     '''
-    nC, nH, nO = 0, 0, 0
-    if atoms.get('C'):
-        nC = atoms['C']
-    else:
+    denom = _Crowl_Louvar_denom(atoms)
+    if denom is None:
         return None
-    if 'H' in atoms:
-        nH = atoms['H']
-    if 'O' in atoms:
-        nO = atoms['O']
-    return 3.5/(4.76*nC + 1.19*nH - 2.38*nO + 1.)
+    return 3.5/denom
 
 def NFPA_30_classification(T_flash, Tb=None, Psat_100F=None):
     r'''Classify a chemical's flammability/combustibility according
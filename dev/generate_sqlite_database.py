@@ -36,10 +36,10 @@ pubchem_db.finish_loading()
 data_reader.USE_CONSTANTS_DATABASE = False
 _RI = RI
 def RI(CASRN):
-    return _RI(CAS)[0]
+    return _RI(CASRN)[0]
 
 def RIT(CASRN):
-    return _RI(CAS)[1]
+    return _RI(CASRN)[1]
 
 funcs = [MW, Tt, Tm, Tb, Tc, Pt, Pc, Vc,
          Zc,omega, T_flash, T_autoignition, LFL, UFL,
@@ -49,31 +49,29 @@ funcs = [MW, Tt, Tm, Tb, Tc, Pt, Pc, Vc,
                      GWP, ODP, RI, RIT, GTP, 
                      hansen_delta_d, hansen_delta_p, hansen_delta_h]
 props = [f.__name__ for f in funcs]
-CASs = []
-prop_array = [[] for _ in range(len(props))]
 
 objs = list(pubchem_db.CAS_index.values())
-stuff = []
-hits = 0
-for v in objs:
+CASs = [v.CASs for v in objs]
+# Preallocate the whole property matrix and write each value in place;
+# this replaces the per-property append lists, their resize churn, and
+# the final np.array().T copy with a single allocation
+prop_array_T = np.full((len(objs), len(props)), np.nan)
+for k, v in enumerate(objs):
     CAS = v.CASs
-    CASs.append(CAS)
     for i, p in enumerate(props):
         if p == 'MW':
             lookedup_constant = float(v.MW)
         else:
             lookedup_constant = funcs[i](CASRN=CAS)
-        if lookedup_constant is None:
-            lookedup_constant = float("nan")
-        prop_array[i].append(lookedup_constant)
+        if lookedup_constant is not None:
+            prop_array_T[k, i] = lookedup_constant
 
-
-
-prop_array_T = np.array(prop_array).T
-CASs_ints = [CAS_to_int(i) for i in CASs]
+# Materialize the index as int64 directly instead of a list of Python ints
+# pandas would re-infer
+CASs_ints = np.fromiter((CAS_to_int(i) for i in CASs), dtype=np.int64, count=len(CASs))
 
 # Would not be good if there were multiple values
-assert len(CASs_ints) == len(set(CASs_ints))
+assert len(CASs_ints) == len(np.unique(CASs_ints))
 
 
 df = pd.DataFrame(prop_array_T, columns=props, index=CASs_ints)
@@ -90,4 +88,8 @@ engine = create_engine('sqlite:///../chemicals/Misc/default.sqlite', echo=False)
 if os.path.exists("../chemicals/Misc/default.sqlite"):
     os.remove("../chemicals/Misc/default.sqlite")
 print('calling pandas to_sql')
-df.to_sql('constants', con=engine)
+# Multi-row inserts in chunks; the default emits one INSERT per compound.
+# Each row binds one parameter per column plus the index, and SQLite caps
+# bound parameters at SQLITE_MAX_VARIABLE_NUMBER (32766 by default), so
+# size the chunks from the column count instead of hardcoding them
+df.to_sql('constants', con=engine, method='multi', chunksize=32766//(len(props) + 1))
@@ -168,6 +168,9 @@ def test_ODP():
 
     assert ODP(CASRN='148875-98-3', method='ODP2 string') == '0.2-2.1'
 
+    # Single-valued string entries stay strings, never coerced to floats
+    assert ODP(CASRN='56-23-5', method='ODP2 string') == '0.82'
+
     methods = ['ODP2 Max', 'ODP1 Max', 'ODP2 logarithmic average', 'ODP1 logarithmic average', 'ODP2 Min', 'ODP1 Min', 'ODP2 string', 'ODP1 string']
 
     assert methods == ODP_methods(CASRN='148875-98-3')
@@ -39,7 +39,9 @@ from chemicals.phase_change import (
     Hvap_data_Gharagheizi,
     Liu,
     Pitzer,
+    Pitzer_vec,
     Riedel,
+    SMK_vec,
     Tb,
     Tb_data_Yaws,
     Tb_methods,
@@ -49,6 +51,7 @@ from chemicals.phase_change import (
     Velasco,
     Vetere,
     Watson,
+    Watson_vec,
     phase_change_data_Alibakhshi_Cs,
     phase_change_data_Perrys2_150,
     phase_change_data_VDI_PPDS_4,
@@ -64,6 +67,24 @@ def test_Watson():
     assert Hvap == 0.0
 
 
+def test_Watson_vec():
+    Ts = [300.0, 320.0, 647.14, 700.0]
+    Hvaps = Watson_vec(Ts, Hvap_ref=43908, T_ref=300.0, Tc=647.14)
+    assert_close1d(Hvaps, [Watson(T, Hvap_ref=43908, T_ref=300.0, Tc=647.14) for T in Ts], rtol=1e-13)
+    # At and above the critical point
+    assert Hvaps[2] == 0.0
+    assert Hvaps[3] == 0.0
+
+    Hvaps = Watson_vec(Ts, Hvap_ref=43908, T_ref=300.0, Tc=647.14, exponent=0.48)
+    assert_close1d(Hvaps, [Watson(T, Hvap_ref=43908, T_ref=300.0, Tc=647.14, exponent=0.48) for T in Ts], rtol=1e-13)
+
+    # Vector call with out memory savings
+    Hvaps_out = [0.0]*4
+    res = Watson_vec(Ts, Hvap_ref=43908, T_ref=300.0, Tc=647.14, exponent=0.48, Hvaps=Hvaps_out)
+    assert res is Hvaps_out
+    assert_close1d(Hvaps_out, Hvaps, rtol=1e-13)
+
+
 def test_Clapeyron():
     Hvap = Clapeyron(294.0, 466.0, 5.55E6)
     assert_close(Hvap, 26512.36357131963)
@@ -82,6 +103,22 @@ def test_Pitzer():
     assert 0.0 == Pitzer(1000.0, 645.6, 0.35017)
 
 
+def test_Pitzer_vec():
+    T = 452.0
+    Tcs = [645.6, 647.096, 400.0]
+    omegas = [0.35017, 0.344, 0.3]
+    Hvaps = Pitzer_vec(T, Tcs, omegas)
+    assert_close1d(Hvaps, [Pitzer(T, Tcs[i], omegas[i]) for i in range(3)], rtol=1e-13)
+    # Supercritical element
+    assert Hvaps[2] == 0.0
+
+    # Vector call with out memory savings
+    Hvaps_out = [0.0]*3
+    res = Pitzer_vec(T, Tcs, omegas, Hvaps=Hvaps_out)
+    assert res is Hvaps_out
+    assert_close1d(Hvaps_out, Hvaps, rtol=1e-13)
+
+
 def test_SMK():
     Hvap = SMK(553.15, 751.35, 0.302)
     assert_close(Hvap, 39866.18999046232)
@@ -91,6 +128,21 @@ def test_SMK():
     assert 0.0 == SMK(800.0, 751.35, 0.302)
 
 
+def test_SMK_vec():
+    Ts = [533.15, 553.15, 751.35, 800.0]
+    Hvaps = SMK_vec(Ts, 751.35, 0.302)
+    assert_close1d(Hvaps, [SMK(T, 751.35, 0.302) for T in Ts], rtol=1e-13)
+    # At and above the critical point
+    assert Hvaps[2] == 0.0
+    assert Hvaps[3] == 0.0
+
+    # Vector call with out memory savings
+    Hvaps_out = [0.0]*4
+    res = SMK_vec(Ts, 751.35, 0.302, Hvaps=Hvaps_out)
+    assert res is Hvaps_out
+    assert_close1d(Hvaps_out, Hvaps, rtol=1e-13)
+
+
 def test_MK():
     # Problem in article for SMK function.
     Hv1 = MK(553.15, 751.35, 0.302)
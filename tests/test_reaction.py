@@ -84,7 +84,7 @@ def test_Hfg_API_TDB_data():
 
 @pytest.mark.slow
 def test_Hfg_API_TDB_data_fuzz():
-    tot = sum([abs(Hfg(i, method='API_TDB_G')) for i in Hfg_API_TDB_data.index])
+    tot = sum(abs(Hfg(i, method='API_TDB_G')) for i in Hfg_API_TDB_data.index)
     assert_close(tot, 101711260.0)
 
 
@@ -95,7 +95,7 @@ def test_Hfl():
     assert Hfl_methods('67-56-1') == ['ATCT_L', 'CRC', 'WEBBOOK']
     assert None is Hfl('98-00-1')
 
-    tot = sum([abs(Hfl(i)) for i in Hfl_ATcT_data.index])
+    tot = sum(abs(Hfl(i)) for i in Hfl_ATcT_data.index)
     assert_close(tot, 6819443.0)
 
     with pytest.raises(Exception):
@@ -125,16 +125,16 @@ def test_Hfs():
 @pytest.mark.fuzz
 @pytest.mark.slow
 def test_Hfg_all_values():
-    tot1 = sum([abs(Hfg(i, method='TRC')) for i in TRC_gas_data.index[pd.notnull(TRC_gas_data['Hfg'])]])
+    tot1 = sum(abs(Hfg(i, method='TRC')) for i in TRC_gas_data.index[pd.notnull(TRC_gas_data['Hfg'])])
     assert_close(tot1, 495689880.0)
 
-    tot2 = sum([abs(Hfg(i, method='ATCT_G')) for i in Hfg_ATcT_data.index])
+    tot2 = sum(abs(Hfg(i, method='ATCT_G')) for i in Hfg_ATcT_data.index)
     assert_close(tot2, 300592764.0)
 
-    tot3 = sum([abs(Hfg(i, method='YAWS')) for i in Hfg_S0g_YAWS_data.index[pd.notnull(Hfg_S0g_YAWS_data['Hfg'])]])
+    tot3 = sum(abs(Hfg(i, method='YAWS')) for i in Hfg_S0g_YAWS_data.index[pd.notnull(Hfg_S0g_YAWS_data['Hfg'])])
     assert_close(tot3, 1544220403.0)
 
-    tot4 = sum([abs(Hfg(i, method='CRC')) for i in CRC_standard_data.index[pd.notnull(CRC_standard_data['Hfg'])]])
+    tot4 = sum(abs(Hfg(i, method='CRC')) for i in CRC_standard_data.index[pd.notnull(CRC_standard_data['Hfg'])])
     assert_close(tot4, 392946600.0)
 
 def test_S0g():
@@ -151,10 +151,10 @@ def test_S0g():
 @pytest.mark.fuzz
 @pytest.mark.slow
 def test_S0g_all_values():
-    tot3 = sum([abs(S0g(i, method='YAWS')) for i in Hfg_S0g_YAWS_data.index[pd.notnull(Hfg_S0g_YAWS_data['S0g'])]])
+    tot3 = sum(abs(S0g(i, method='YAWS')) for i in Hfg_S0g_YAWS_data.index[pd.notnull(Hfg_S0g_YAWS_data['S0g'])])
     assert_close(tot3, 2690113.4130000058)
 
-    tot4 = sum([abs(S0g(i, method='CRC')) for i in CRC_standard_data.index[pd.notnull(CRC_standard_data['S0g'])]])
+    tot4 = sum(abs(S0g(i, method='CRC')) for i in CRC_standard_data.index[pd.notnull(CRC_standard_data['S0g'])])
     assert_close(tot4, 141558.30000000008)
 
 
@@ -207,8 +207,8 @@ def test_entropy_formation():
 
 def check_reaction_balance(matrix, products_calc, atol=1e-13):
     """Check that coefficients satisfy the stoichiometric matrix equation within tolerance."""
-    result = np.array(matrix) @ np.array(products_calc)
-    assert_close1d(result, [0.0]*len(result), atol=atol)
+    result = np.asarray(matrix, dtype=np.float64).dot(np.asarray(products_calc, dtype=np.float64))
+    assert_close1d(result, np.zeros_like(result), atol=atol)
 
 ill_conditioned_stoich_test_cases = [
     (
@@ -1914,27 +1914,17 @@ def test_stoichiometric_matrix():
     assert_close2d([[1, -1, 0], [1, 0, -2]], res)
 
 
-def test_standard_formation_reaction():
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 3, 'H': 8})
-    assert coeff_test == [3.0, 4.0]
-    assert reactant_atomss_test == [{'C': 1}, {'H': 2}]
-
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 3, 'H': 7, 'N': 1, 'O': 2, 'S': 1})
-    assert coeff_test == [6.0, 7.0, 1.0, 2.0, 2.0]
-    assert reactant_atomss_test == [{'C': 1}, {'H': 2}, {'N': 2}, {'O': 2}, {'S': 1}]
-
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 6, 'H': 7, 'B': 1, 'O': 2})
-    assert coeff_test == [12.0, 7.0, 2.0, 2.0]
-    assert reactant_atomss_test == [{'C': 1}, {'H': 2}, {'B': 1}, {'O': 2}]
-
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 4, 'H': 12, 'Si': 1})
-    assert coeff_test == [4.0, 6.0, 1.0]
-    assert reactant_atomss_test ==  [{'C': 1}, {'H': 2}, {'Si': 1}]
-
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 12, 'H': 10, 'Cl': 1, 'P': 1})
-    assert coeff_test == [24.0, 10.0, 1.0, 2.0]
-    assert reactant_atomss_test ==  [{'C': 1}, {'H': 2}, {'Cl': 2}, {'P': 1}]
+standard_formation_reaction_test_cases = [
+    ({'C': 3, 'H': 8}, [3.0, 4.0], [{'C': 1}, {'H': 2}]),
+    ({'C': 3, 'H': 7, 'N': 1, 'O': 2, 'S': 1}, [6.0, 7.0, 1.0, 2.0, 2.0], [{'C': 1}, {'H': 2}, {'N': 2}, {'O': 2}, {'S': 1}]),
+    ({'C': 6, 'H': 7, 'B': 1, 'O': 2}, [12.0, 7.0, 2.0, 2.0], [{'C': 1}, {'H': 2}, {'B': 1}, {'O': 2}]),
+    ({'C': 4, 'H': 12, 'Si': 1}, [4.0, 6.0, 1.0], [{'C': 1}, {'H': 2}, {'Si': 1}]),
+    ({'C': 12, 'H': 10, 'Cl': 1, 'P': 1}, [24.0, 10.0, 1.0, 2.0], [{'C': 1}, {'H': 2}, {'Cl': 2}, {'P': 1}]),
+    ({'C': 2, 'H': 4, 'Br': 1, 'F': 1}, [4.0, 4.0, 1.0, 1.0], [{'C': 1}, {'H': 2}, {'Br': 2}, {'F': 2}]),
+]
 
-    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction({'C': 2, 'H': 4, 'Br': 1, 'F': 1})
-    assert coeff_test == [4.0, 4.0, 1.0, 1.0]
-    assert reactant_atomss_test == [{'C': 1}, {'H': 2}, {'Br': 2}, {'F': 2}]
+@pytest.mark.parametrize("atoms,expected_coeffs,expected_atomss", standard_formation_reaction_test_cases)
+def test_standard_formation_reaction(atoms, expected_coeffs, expected_atomss):
+    reactant_coeff, coeff_test, reactant_atomss_test = standard_formation_reaction(atoms)
+    assert coeff_test == expected_coeffs
+    assert reactant_atomss_test == expected_atomss